@@ -0,0 +1,98 @@
+# _fast.py
+# Optional JIT-compiled hand scoring for bots and simulation drivers.
+#
+# When numba (and numpy) are installed, the helpers below are compiled to
+# native code. Otherwise they fall back to plain Python with the same
+# results, so callers never need to check which version they got.
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# -----------------------------
+# Card values
+# -----------------------------
+# Blackjack value of each rank, indexed by rank (index 0 is unused and
+# worth 0, so it can also be used to pad hands of different sizes)
+_CARD_VALUE_LIST = (0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+HAVE_NUMBA = njit is not None
+
+if HAVE_NUMBA:
+    _CARD_VALUE = np.array(_CARD_VALUE_LIST, dtype=np.uint8)
+
+    @njit(cache=True)
+    def hand_value_np(ranks) -> int:
+        """
+        Calculates the total Blackjack value of a single hand.
+
+        Input:
+            ranks (np.ndarray): A 1-D uint8 array of card ranks (1–13).
+            Entries equal to 0 are treated as padding and add nothing.
+
+        Output:
+            int: The sum of the values of all cards in the hand.
+        """
+        total = 0
+        for r in ranks:
+            total += _CARD_VALUE[r]
+        return total
+
+    @njit(cache=True)
+    def hand_values_batch(ranks_2d):
+        """
+        Calculates the Blackjack value of many hands in one call.
+
+        Each row holds one hand; shorter hands are padded with rank 0.
+
+        Input:
+            ranks_2d (np.ndarray): A 2-D uint8 array of shape
+            (num_hands, max_cards) containing card ranks.
+
+        Output:
+            np.ndarray: A 1-D int64 array with the total of each row.
+        """
+        n_hands, n_cards = ranks_2d.shape
+        totals = np.zeros(n_hands, dtype=np.int64)
+        for i in range(n_hands):
+            total = 0
+            for j in range(n_cards):
+                total += _CARD_VALUE[ranks_2d[i, j]]
+            totals[i] = total
+        return totals
+
+else:
+    _CARD_VALUE = _CARD_VALUE_LIST
+
+    def hand_value_np(ranks) -> int:
+        """
+        Calculates the total Blackjack value of a single hand.
+
+        Pure-Python fallback used when numba is not installed.
+
+        Input:
+            ranks: A sequence of card ranks (1–13).
+            Entries equal to 0 are treated as padding and add nothing.
+
+        Output:
+            int: The sum of the values of all cards in the hand.
+        """
+        return sum(_CARD_VALUE[int(r)] for r in ranks)
+
+    def hand_values_batch(ranks_2d):
+        """
+        Calculates the Blackjack value of many hands in one call.
+
+        Pure-Python fallback used when numba is not installed.
+
+        Input:
+            ranks_2d: A sequence of hands, each a sequence of card ranks.
+            Shorter hands may be padded with rank 0.
+
+        Output:
+            list[int]: The total of each hand.
+        """
+        return [hand_value_np(row) for row in ranks_2d]
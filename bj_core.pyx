@@ -0,0 +1,174 @@
+# bj_core.pyx
+# distutils: extra_compile_args = -O3 -march=native
+# cython: language_level=3, boundscheck=False, wraparound=False
+#
+# Optional compiled versions of the server's deck and hand scoring.
+# Build in place with:
+#   pip install cython
+#   cythonize -i bj_core.pyx
+# server.py uses this module automatically when it has been built.
+import os as _os
+
+from libc.stdint cimport uint32_t, uint64_t
+
+# -----------------------------
+# Card values
+# -----------------------------
+# Blackjack value of each rank, indexed by rank (index 0 is unused)
+cdef unsigned char _CARD_VALUE[14]
+for _rank, _value in enumerate((0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)):
+    _CARD_VALUE[_rank] = _value
+
+# All 52 card codes (rank | suit << 4) in the same order as server.py
+cdef unsigned char _FULL_DECK[52]
+for _i in range(52):
+    _FULL_DECK[_i] = (_i % 13 + 1) | (_i // 13) << 4
+
+
+cdef inline int c_card_value(int rank) nogil:
+    return _CARD_VALUE[rank]
+
+
+cpdef int card_value(int rank) except -1:
+    """
+    Calculates the Blackjack value of a card based on its rank.
+
+    Input:
+        rank (int): The rank of the card (1–13).
+
+    Output:
+        int: The Blackjack value of the card.
+
+    Raises:
+        IndexError: If the rank is out of range.
+    """
+    if rank < 0 or rank > 13:
+        raise IndexError("rank out of range")
+    return c_card_value(rank)
+
+
+cpdef int hand_value(const unsigned char[:] hand) except -1:
+    """
+    Calculates the total Blackjack value of a hand.
+
+    Input:
+        hand (bytes | bytearray): The hand's card codes, each packing
+        rank | suit << 4.
+
+    Output:
+        int: The sum of the Blackjack values of all cards in the hand.
+
+    Raises:
+        IndexError: If a card's rank is out of range.
+    """
+    cdef int total = 0
+    cdef Py_ssize_t i
+    cdef int rank
+    for i in range(hand.shape[0]):
+        rank = hand[i] & 0xF
+        if rank > 13:
+            raise IndexError("rank out of range")
+        total += c_card_value(rank)
+    return total
+
+# -----------------------------
+# Random numbers
+# -----------------------------
+cdef inline uint64_t rotl(uint64_t x, int k) nogil:
+    return (x << k) | (x >> (64 - k))
+
+
+cdef inline uint64_t xoshiro_next(uint64_t* s) nogil:
+    # xoshiro256** by Blackman and Vigna
+    cdef uint64_t result = rotl(s[1] * 5, 7) * 9
+    cdef uint64_t t = s[1] << 17
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = rotl(s[3], 45)
+    return result
+
+
+cdef inline uint32_t xoshiro_below(uint64_t* s, uint32_t n) nogil:
+    # Unbiased integer in [0, n) using Lemire's multiply-and-reject method
+    cdef uint64_t m = (xoshiro_next(s) >> 32) * n
+    cdef uint32_t low = <uint32_t>m
+    cdef uint32_t threshold
+    if low < n:
+        threshold = (<uint32_t>0 - n) % n
+        while low < threshold:
+            m = (xoshiro_next(s) >> 32) * n
+            low = <uint32_t>m
+    return <uint32_t>(m >> 32)
+
+# -----------------------------
+# Deck
+# -----------------------------
+cdef class FastDeck:
+    """
+    Compiled drop-in replacement for server.Deck.
+
+    The deck is stored as 52 one-byte card codes; each draw picks a
+    random undrawn card (one Fisher-Yates step) and returns its code.
+    Cards are picked with an inline
+    xoshiro256** generator instead of calling back into Python.
+    """
+    cdef unsigned char cards[52]
+    cdef int remaining
+    cdef uint64_t state[4]
+
+    def __init__(self, rng=None):
+        """
+        Initializes a new deck with all 52 cards available.
+
+        Input:
+            rng: Optional random number generator used only to seed the
+            deck's own generator (through getrandbits), e.g. a seeded
+            random.Random for a reproducible deck. When not provided,
+            the deck is seeded from os.urandom.
+
+        Output:
+            None
+        """
+        cdef int i
+        for i in range(52):
+            self.cards[i] = _FULL_DECK[i]
+        self.remaining = 52
+
+        if rng is None:
+            seed = _os.urandom(32)
+            for i in range(4):
+                self.state[i] = int.from_bytes(seed[8 * i:8 * i + 8], "little")
+        else:
+            for i in range(4):
+                self.state[i] = rng.getrandbits(64)
+
+        # The all-zero state is the one state xoshiro never leaves
+        if not (self.state[0] | self.state[1] | self.state[2] | self.state[3]):
+            self.state[0] = 1
+
+    cpdef draw(self):
+        """
+        Draws a uniformly random card from the cards not yet drawn.
+
+        Input:
+            None
+
+        Output:
+            int: The card's one-byte code, rank | suit << 4.
+
+        Raises:
+            ValueError: If every card has already been drawn.
+        """
+        if self.remaining == 0:
+            raise ValueError("draw from an empty deck")
+
+        cdef int i = xoshiro_below(self.state, self.remaining)
+        cdef unsigned char code = self.cards[i]
+
+        self.remaining -= 1
+        self.cards[i] = self.cards[self.remaining]
+        self.cards[self.remaining] = code
+        return code
@@ -1,17 +1,50 @@
 # client.py
+import re
 import socket
+import sys
 from protocol import *
 
 SERVER_PAYLOAD_SIZE = 9  # 4 + 1 + 1 + 2 + 1
+OFFER_SIZE = 39  # 4 + 1 + 2 + 32
 
 # -----------------------------
 # Configuration
 # -----------------------------
 CLIENT_NAME = "BlackijeckyClient"
+_CLIENT_NAME_ENC = encode_team_name(CLIENT_NAME)
+TCP_SNDBUF_SIZE = 1 << 18
+TCP_RCVBUF_SIZE = 1 << 22
 
 # -----------------------------
 # Helpers
 # -----------------------------
+# Blackjack value of each rank, indexed by rank (index 0 is unused)
+_CARD_VALUE = (0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
+# A number of rounds between 1 and 255 (leading zeros allowed)
+_ROUNDS_RE = re.compile(r"0*(?:[1-9][0-9]?|1[0-9][0-9]|2[0-4][0-9]|25[0-5])")
+
+# Display names indexed by rank (index 0 is unused) and by suit
+_RANK_NAMES = (None, "Ace", "2", "3", "4", "5", "6", "7", "8", "9", "10", "Jack", "Queen", "King")
+_SUIT_NAMES = ("Hearts", "Diamonds", "Clubs", "Spades")
+
+# Message printed for each final result code
+_RESULT_MESSAGES = {
+    RESULT_TIE: "It's a tie!",
+    RESULT_LOSS: "You lose!",
+    RESULT_WIN: "You win!",
+}
+
+# "hit N": draw up to N cards (1-255) in a single request
+_HIT_MANY_RE = re.compile(r"hit\s+0*([1-9][0-9]?|1[0-9][0-9]|2[0-4][0-9]|25[0-5])")
+
+# Only this project's server understands the non-standard HitN decision,
+# so "hit N" is only offered to servers announcing this name
+_HIT_MANY_SERVER_NAME = "BlackijeckyServer"
+
+# Decisions the player may type at the Hit/Stand prompt
+_ACCEPTED_DECISIONS = frozenset(DECISION_PACKETS)
+
 def card_value(rank: int) -> int:
     """
     Calculates the Blackjack value of a card based on its rank.
@@ -28,11 +61,7 @@ def card_value(rank: int) -> int:
             face cards are counted as 10,
             numeric cards keep their numeric value.
     """
-    if rank == 1:
-        return 11
-    if rank >= 11:
-        return 10
-    return rank
+    return _CARD_VALUE[rank]
 
 
 def hand_value(hand):
@@ -45,9 +74,9 @@ def hand_value(hand):
 
     Output:
         int: The sum of the values of all cards in the hand,
-        computed using card_value.
+        computed from the _CARD_VALUE table.
     """
-    return sum(card_value(rank) for rank, _ in hand)
+    return sum(_CARD_VALUE[rank] for rank, _ in hand)
 
 
 def rank_to_name(rank: int) -> str:
@@ -65,14 +94,8 @@ def rank_to_name(rank: int) -> str:
             13 returns "King",
             otherwise the numeric rank as a string.
     """
-    if rank == 1:
-        return "Ace"
-    if rank == 11:
-        return "Jack"
-    if rank == 12:
-        return "Queen"
-    if rank == 13:
-        return "King"
+    if 1 <= rank <= 13:
+        return _RANK_NAMES[rank]
     return str(rank)
 
 
@@ -91,21 +114,26 @@ def suit_to_name(suit: int) -> str:
         str: The name of the suit in English,
         or "Unknown" if the identifier is invalid.
     """
-    if suit == 0:
-        return "Hearts"
-    if suit == 1:
-        return "Diamonds"
-    if suit == 2:
-        return "Clubs"
-    if suit == 3:
-        return "Spades"
+    if 0 <= suit <= 3:
+        return _SUIT_NAMES[suit]
     return "Unknown"
 
 
+# Display names of all 52 cards, indexed by (rank - 1) * 4 + suit
+_CARD_NAMES = tuple(
+    f"{rank_to_name(rank)} of {suit_to_name(suit)}"
+    for rank in range(1, 14)
+    for suit in range(4)
+)
+
+
 def format_card(card) -> str:
     """
     Formats a single card as a readable string.
 
+    Valid cards are looked up in the precomputed _CARD_NAMES table;
+    anything else is formatted from the rank and suit names.
+
     Input:
         card (tuple[int, int]): A card represented as (rank, suit).
 
@@ -115,6 +143,8 @@ def format_card(card) -> str:
         Example: "King of Hearts".
     """
     rank, suit = card
+    if 1 <= rank <= 13 and 0 <= suit <= 3:
+        return _CARD_NAMES[(rank - 1) * 4 + suit]
     return f"{rank_to_name(rank)} of {suit_to_name(suit)}"
 
 
@@ -132,6 +162,23 @@ def format_hand(hand) -> str:
     """
     return ", ".join(format_card(c) for c in hand)
 
+
+def flush_output(out) -> None:
+    """
+    Writes all buffered output lines to stdout with a single write.
+
+    Input:
+        out (list[str]): Pending output lines, each ending with a newline.
+        The list is cleared after writing.
+
+    Output:
+        None
+    """
+    if out:
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        out.clear()
+
 # -----------------------------
 # Main
 # -----------------------------
@@ -140,16 +187,15 @@ def main():
     while True:
         user_input = input("Enter number of rounds to play (1-255): ").strip()
 
-        if not user_input.isdigit():
-            print("Please enter a valid number")
+        # A single match validates both the format and the range
+        if not _ROUNDS_RE.fullmatch(user_input):
+            if not user_input.isdigit():
+                print("Please enter a valid number")
+            else:
+                print("Number of rounds must be between 1 and 255")
             continue
 
         rounds = int(user_input)
-
-        if not (1 <= rounds <= 255):
-            print("Number of rounds must be between 1 and 255")
-            continue
-
         break
 
     # Create UDP socket to listen for broadcast offers from servers
@@ -165,34 +211,55 @@ def main():
     udp_sock.bind(("", UDP_PORT))
     print("Client started, listening for offer requests...")
 
+    # Fixed-size receive buffer sized to exactly one offer packet
+    offer_buf = bytearray(OFFER_SIZE)
+    offer_view = memoryview(offer_buf)
+
+    # Game output is collected here and written in one call per prompt
+    out = []
+
     while True:
         try:
             # Wait for a UDP offer packet from any server
-            data, addr = udp_sock.recvfrom(1024)
+            nbytes, addr = udp_sock.recvfrom_into(offer_buf, OFFER_SIZE)
 
             try:
                 # Parse offer packet, ignore invalid or unrelated packets
-                tcp_port, server_name = unpack_offer(data)
+                tcp_port, server_name = unpack_offer(offer_view[:nbytes])
             except ValueError:
                 continue
 
             server_ip = addr[0]
             print(f"Received offer from {server_ip} ({server_name})")
+            hit_many_supported = server_name == _HIT_MANY_SERVER_NAME
 
             # Connect to the server over TCP using the port from the offer
             tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+            # Disable Nagle so small decision packets are sent immediately
+            tcp_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                # Enlarge kernel buffers so card bursts need fewer recv calls
+                tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SNDBUF_SIZE)
+                tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TCP_RCVBUF_SIZE)
+            except OSError:
+                pass
+
             tcp_sock.connect((server_ip, tcp_port))
 
             # Send game request including number of rounds and client name
-            tcp_sock.sendall(pack_request(rounds, CLIENT_NAME))
+            tcp_sock.sendall(pack_request_raw(rounds, _CLIENT_NAME_ENC))
             print("Request sent to server")
 
             wins = 0
             losses = 0
             ties = 0
 
+            # Buffered reader so back-to-back cards are received in one call
+            reader = BytesReader(tcp_sock)
+
             for r in range(1, rounds + 1):
-                print(f"\n--- Round {r}/{rounds} ---")
+                out.append(f"\n--- Round {r}/{rounds} ---\n")
 
                 player_hand = []
                 dealer_hand = []
@@ -200,88 +267,118 @@ def main():
                 # -------- Initial cards --------
                 for _ in range(2):
                     _, rank, suit = unpack_server_payload(
-                        recv_exact(tcp_sock, SERVER_PAYLOAD_SIZE)
+                        reader.read_exact(SERVER_PAYLOAD_SIZE)
                     )
                     player_hand.append((rank, suit))
 
                 _, rank, suit = unpack_server_payload(
-                    recv_exact(tcp_sock, SERVER_PAYLOAD_SIZE)
+                    reader.read_exact(SERVER_PAYLOAD_SIZE)
                 )
                 dealer_hand.append((rank, suit))
 
-                print(f"Player cards: {format_hand(player_hand)}, total={hand_value(player_hand)}")
-                print(f"Dealer shows: {format_card(dealer_hand[0])}")
+                # Running totals, updated as each card arrives instead of
+                # re-scanning the hands
+                player_total = _CARD_VALUE[player_hand[0][0]] + _CARD_VALUE[player_hand[1][0]]
+                dealer_total = _CARD_VALUE[dealer_hand[0][0]]
+
+                out.append(f"Player cards: {format_hand(player_hand)}, total={player_total}\n")
+                out.append(f"Dealer shows: {format_card(dealer_hand[0])}\n")
 
                 # -------- Player turn --------
                 player_bust = False
 
                 while True:
+                    # Show everything gathered so far before prompting
+                    flush_output(out)
                     decision = input("Hit or Stand? ").strip().lower()
-                    if decision not in ("hit", "stand"):
-                        print("Invalid input")
+
+                    # "hit N" asks for up to N cards without further prompts
+                    hits = 1
+                    match = _HIT_MANY_RE.fullmatch(decision)
+                    if match:
+                        hits = int(match.group(1))
+                        if hits > 1 and not hit_many_supported:
+                            out.append("This server only accepts one hit at a time\n")
+                            continue
+                    elif decision not in _ACCEPTED_DECISIONS:
+                        out.append("Invalid input\n")
                         continue
-                    
-                    # Send player's decision to the server
-                    tcp_sock.sendall(pack_client_payload(decision))
+
+                    # Send player's decision to the server; a single hit
+                    # always uses the standard packet
+                    if hits > 1:
+                        send_packet(tcp_sock, pack_client_hit_many(hits))
+                    elif match:
+                        send_packet(tcp_sock, DECISION_PACKETS["hit"])
+                    else:
+                        send_packet(tcp_sock, DECISION_PACKETS[decision])
 
                     if decision == "stand":
-                        print("You chose to stand")
+                        out.append("You chose to stand\n")
                         break
 
-                    result, rank, suit = unpack_server_payload(
-                        recv_exact(tcp_sock, SERVER_PAYLOAD_SIZE)
-                    )
-
-                    if result == RESULT_NOT_OVER:
-                        player_hand.append((rank, suit))
-                        total = hand_value(player_hand)
-                        print(f"You drew {format_card((rank, suit))}, total={total}")
-
-                        if total > 21:
-                            print("Bust!")
-                            player_bust = True
-                            losses += 1
-                            break
+                    # The server deals up to the requested number of cards,
+                    # stopping early if the player busts
+                    for _ in range(hits):
+                        result, rank, suit = unpack_server_payload(
+                            reader.read_exact(SERVER_PAYLOAD_SIZE)
+                        )
+
+                        if result == RESULT_NOT_OVER:
+                            player_hand.append((rank, suit))
+                            player_total += _CARD_VALUE[rank]
+                            out.append(f"You drew {format_card((rank, suit))}, total={player_total}\n")
+
+                            if player_total > 21:
+                                player_bust = True
+                                break
+
+                    if player_bust:
+                        out.append("Bust!\n")
+                        losses += 1
+                        break
 
                 # -------- Dealer stream--------
                 if not player_bust:
-                    print("Dealer turn:")
+                    out.append("Dealer turn:\n")
 
                 while True:
                     result, rank, suit = unpack_server_payload(
-                        recv_exact(tcp_sock, SERVER_PAYLOAD_SIZE)
+                        reader.read_exact(SERVER_PAYLOAD_SIZE)
                     )
 
-                    if result in (RESULT_WIN, RESULT_LOSS, RESULT_TIE):
-                        print(f"Dealer final hand: {format_hand(dealer_hand)}")
+                    # Final result markers have a message; cards do not
+                    message = _RESULT_MESSAGES.get(result)
+                    if message is not None:
+                        out.append(f"Dealer final hand: {format_hand(dealer_hand)}, total={dealer_total}\n")
+                        out.append(message + "\n")
 
                         if result == RESULT_WIN:
-                            print("You win!")
                             wins += 1
-                        elif result == RESULT_LOSS:
-                            if not player_bust:
-                                losses += 1
-                            print("You lose!")
-                        else:
-                            print("It's a tie!")
+                        elif result == RESULT_TIE:
                             ties += 1
+                        elif not player_bust:
+                            losses += 1
                         break
 
                     dealer_hand.append((rank, suit))
+                    dealer_total += _CARD_VALUE[rank]
                     if not player_bust:
-                        print(f"Dealer draws {format_card((rank, suit))}")
+                        out.append(f"Dealer draws {format_card((rank, suit))}\n")
 
             win_rate = wins / rounds if rounds > 0 else 0.0
-            print(
+            out.append(
                 f"\nFinished playing {rounds} rounds, "
                 f"wins={wins}, losses={losses}, ties={ties}, "
-                f"win rate={win_rate:.2f}"
+                f"win rate={win_rate:.2f}\n"
             )
+            flush_output(out)
 
             tcp_sock.close()
             break
 
         except Exception as e:
+            flush_output(out)
             print(f"[Client] Error: {e}")
 
 # -----------------------------
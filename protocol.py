@@ -24,6 +24,11 @@ RESULT_WIN      = 0x3
 DECISION_HIT   = b"Hittt"
 DECISION_STAND = b"Stand"
 
+# Extended decision: hit up to N times in a row without waiting for
+# another decision (prefix followed by a one-byte card count)
+DECISION_HIT_MANY = b"HitN"
+MAX_HIT_MANY = 255
+
 # -----------------------------
 # Helpers
 # -----------------------------
@@ -71,7 +76,7 @@ def decode_team_name(raw: bytes) -> str:
     return raw.split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
 
 
-def recv_exact(sock: socket.socket, n: int) -> bytes:
+def recv_exact(sock: socket.socket, n: int, buf=None):
     """
     Receives exactly n bytes from a socket.
 
@@ -80,30 +85,147 @@ def recv_exact(sock: socket.socket, n: int) -> bytes:
     used to safely handle TCP streams, where a single recv call may return
     fewer bytes than requested.
 
+    The data is received directly into a single buffer using recv_into,
+    so no intermediate chunks are allocated or concatenated. Callers that
+    read many fixed-size packets can pass the same buffer on every call.
+
     Input:
         sock (socket.socket): The socket from which to receive data.
         n (int): The exact number of bytes to receive.
+        buf (bytearray | memoryview | None): Optional writable buffer of
+        at least n bytes to receive into. A new bytearray is allocated
+        when not provided.
 
     Output:
-        bytes: A byte sequence of length n containing the received data.
+        bytearray | memoryview: The buffer holding the n received bytes.
 
     Raises:
         ConnectionError: If the socket is closed before all bytes are received.
     """
-    # Accumulate received data until the required length is reached
-    data = b""
-    while len(data) < n:
-        # Receive the remaining number of bytes
-        chunk = sock.recv(n - len(data))
+    # Allocate the destination buffer once if the caller did not supply one
+    if buf is None:
+        buf = bytearray(n)
+
+    recv_exact_into(sock, memoryview(buf), n)
+    return buf
+
+
+def recv_exact_into(sock: socket.socket, mv: memoryview, n: int) -> None:
+    """
+    Receives exactly n bytes from a socket into an existing buffer.
 
-        # If recv returns no data, the connection has been closed
-        if not chunk:
+    This is the allocation-free core of recv_exact: the data is written
+    straight into the first n bytes of mv with recv_into.
+
+    Input:
+        sock (socket.socket): The socket from which to receive data.
+        mv (memoryview): A writable view of at least n bytes.
+        n (int): The exact number of bytes to receive.
+
+    Output:
+        None
+
+    Raises:
+        ConnectionError: If the socket is closed before all bytes are received.
+    """
+    # Fill the buffer until the required length is reached
+    off = 0
+    while off < n:
+        # Receive the remaining number of bytes directly into the buffer
+        got = sock.recv_into(mv[off:n])
+
+        # If recv_into returns no data, the connection has been closed
+        if got == 0:
             raise ConnectionError("Socket closed while receiving data")
 
-        # Append the newly received chunk
-        data += chunk
+        off += got
+
+
+class BytesReader:
+    """
+    Buffered reader for fixed-size packets arriving on a TCP stream.
 
-    return data
+    Instead of one recv call per packet, the reader pulls everything that
+    is currently available (up to the buffer size) into a single
+    pre-allocated buffer and hands out packets from it. When the server
+    streams several payloads back-to-back they are all consumed with one
+    system call.
+    """
+    def __init__(self, sock: socket.socket, bufsize: int = 4096):
+        """
+        Initializes a reader on top of a connected socket.
+
+        Input:
+            sock (socket.socket): The connected TCP socket to read from.
+            bufsize (int): Size of the internal receive buffer in bytes.
+
+        Output:
+            None
+        """
+        self.sock = sock
+        self.buf = bytearray(bufsize)
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+
+    def read_exact(self, n: int) -> memoryview:
+        """
+        Returns the next n bytes of the stream.
+
+        The returned memoryview points into the reader's internal buffer
+        and is only valid until the next call to read_exact.
+
+        Input:
+            n (int): The exact number of bytes to read.
+
+        Output:
+            memoryview: A view of length n over the received data.
+
+        Raises:
+            ConnectionError: If the socket is closed before n bytes are
+            available.
+        """
+        if self.end - self.start < n:
+            self._fill(n)
+
+        data = self.view[self.start:self.start + n]
+        self.start += n
+        return data
+
+    def _fill(self, n: int) -> None:
+        """
+        Receives from the socket until at least n unread bytes are buffered.
+
+        Input:
+            n (int): The number of unread bytes required.
+
+        Output:
+            None
+
+        Raises:
+            ValueError: If n is larger than the buffer.
+            ConnectionError: If the socket is closed before enough data
+            is received.
+        """
+        if n > len(self.buf):
+            raise ValueError("Read size exceeds reader buffer")
+
+        # Move any unread bytes to the front of the buffer
+        pending = self.end - self.start
+        if pending:
+            self.buf[:pending] = self.buf[self.start:self.end]
+        self.start = 0
+        self.end = pending
+
+        # Pull whatever is available, as many times as needed
+        while self.end < n:
+            got = self.sock.recv_into(self.view[self.end:])
+
+            # If recv_into returns no data, the connection has been closed
+            if got == 0:
+                raise ConnectionError("Socket closed while receiving data")
+
+            self.end += got
 
 
 # -----------------------------
@@ -111,7 +233,8 @@ def recv_exact(sock: socket.socket, n: int) -> bytes:
 # -----------------------------
 # Format: cookie(4) | type(1) | tcp_port(2) | server_name(32)
 _OFFER_FMT = "!I B H 32s"
-_OFFER_SIZE = struct.calcsize(_OFFER_FMT)
+_OFFER = struct.Struct(_OFFER_FMT)
+_OFFER_SIZE = _OFFER.size
 
 def pack_offer(tcp_port: int, server_name: str) -> bytes:
     """
@@ -130,8 +253,7 @@ def pack_offer(tcp_port: int, server_name: str) -> bytes:
         bytes: A packed byte sequence representing the offer packet,
         formatted according to _OFFER_FMT and ready to be sent over UDP.
     """
-    return struct.pack(
-        _OFFER_FMT,
+    return _OFFER.pack(
         MAGIC_COOKIE,
         OFFER_TYPE,
         tcp_port,
@@ -166,9 +288,7 @@ def unpack_offer(data: bytes):
         raise ValueError("Offer packet too short")
 
     # Unpack the offer packet according to the defined format
-    cookie, msg_type, tcp_port, raw_name = struct.unpack(
-        _OFFER_FMT, data[:_OFFER_SIZE]
-    )
+    cookie, msg_type, tcp_port, raw_name = _OFFER.unpack_from(data, 0)
 
     # Validate protocol identifiers
     if cookie != MAGIC_COOKIE or msg_type != OFFER_TYPE:
@@ -182,7 +302,8 @@ def unpack_offer(data: bytes):
 # -----------------------------
 # Format: cookie(4) | type(1) | rounds(1) | client_name(32)
 _REQUEST_FMT = "!I B B 32s"
-_REQUEST_SIZE = struct.calcsize(_REQUEST_FMT)
+_REQUEST = struct.Struct(_REQUEST_FMT)
+_REQUEST_SIZE = _REQUEST.size
 
 def pack_request(rounds: int, client_name: str) -> bytes:
     """
@@ -202,12 +323,29 @@ def pack_request(rounds: int, client_name: str) -> bytes:
         formatted according to _REQUEST_FMT and ready to be sent over a
         TCP socket.
     """
-    return struct.pack(
-        _REQUEST_FMT,
+    return pack_request_raw(rounds, encode_team_name(client_name))
+
+
+def pack_request_raw(rounds: int, name_bytes: bytes) -> bytes:
+    """
+    Packs a client game request using an already encoded client name.
+
+    This lets callers with a constant name run encode_team_name once
+    and reuse the result for every request.
+
+    Input:
+        rounds (int): The number of Blackjack rounds requested by the client.
+        name_bytes (bytes): The client name as returned by encode_team_name.
+
+    Output:
+        bytes: A packed byte sequence representing the request packet,
+        formatted according to _REQUEST_FMT.
+    """
+    return _REQUEST.pack(
         MAGIC_COOKIE,
         REQUEST_TYPE,
         rounds,
-        encode_team_name(client_name)
+        name_bytes
     )
 
 
@@ -237,9 +375,7 @@ def unpack_request(data: bytes):
         raise ValueError("Request packet too short")
 
     # Unpack the request packet according to the defined format
-    cookie, msg_type, rounds, raw_name = struct.unpack(
-        _REQUEST_FMT, data[:_REQUEST_SIZE]
-    )
+    cookie, msg_type, rounds, raw_name = _REQUEST.unpack_from(data, 0)
 
     # Validate protocol identifiers
     if cookie != MAGIC_COOKIE or msg_type != REQUEST_TYPE:
@@ -254,15 +390,28 @@ def unpack_request(data: bytes):
 # -----------------------------
 # Format: cookie(4) | type(1) | decision(5)
 _CLIENT_PAYLOAD_FMT = "!I B 5s"
-_CLIENT_PAYLOAD_SIZE = struct.calcsize(_CLIENT_PAYLOAD_FMT)
+_CLIENT_PAYLOAD = struct.Struct(_CLIENT_PAYLOAD_FMT)
+_CLIENT_PAYLOAD_SIZE = _CLIENT_PAYLOAD.size
+
+# Complete client payloads for both possible decisions, packed once
+DECISION_PACKETS = {
+    "hit": _CLIENT_PAYLOAD.pack(MAGIC_COOKIE, PAYLOAD_TYPE, DECISION_HIT),
+    "stand": _CLIENT_PAYLOAD.pack(MAGIC_COOKIE, PAYLOAD_TYPE, DECISION_STAND),
+}
+
+# Human-readable command for each decision value
+_DECISION_NAMES = {
+    DECISION_HIT: "Hit",
+    DECISION_STAND: "Stand",
+}
 
 def pack_client_payload(decision: str) -> bytes:
     """
     Packs a player's decision into a client payload for transmission
     to the server over TCP.
 
-    This function converts a human-readable decision string into the
-    fixed-size binary format defined by the protocol.
+    Only two payloads exist, so both are packed once at import time in
+    DECISION_PACKETS and this function simply looks up the right one.
 
     Input:
         decision (str): The player's decision.
@@ -276,23 +425,60 @@ def pack_client_payload(decision: str) -> bytes:
     Raises:
         ValueError: If the provided decision is not valid.
     """
-    # Convert the decision string to the corresponding protocol constant
-    if decision.lower() == "hit":
-        d = DECISION_HIT
-    elif decision.lower() == "stand":
-        d = DECISION_STAND
-    else:
-        raise ValueError("Invalid decision")
-
-    # Pack the payload according to the client payload format
-    return struct.pack(
-        _CLIENT_PAYLOAD_FMT,
+    try:
+        return DECISION_PACKETS[decision.lower()]
+    except KeyError:
+        raise ValueError("Invalid decision") from None
+
+
+def pack_client_hit_many(count: int) -> bytes:
+    """
+    Packs a request to hit up to count times in a row.
+
+    The server deals the cards one after another in a single write,
+    stopping early if the player busts, and only then waits for the next
+    decision. This saves one network round trip per extra card.
+
+    Input:
+        count (int): The maximum number of cards to draw (1–MAX_HIT_MANY).
+
+    Output:
+        bytes: A packed client payload formatted according to
+        _CLIENT_PAYLOAD_FMT.
+
+    Raises:
+        ValueError: If count is out of range.
+    """
+    if not 1 <= count <= MAX_HIT_MANY:
+        raise ValueError("Invalid hit count")
+
+    return _CLIENT_PAYLOAD.pack(
         MAGIC_COOKIE,
         PAYLOAD_TYPE,
-        d
+        DECISION_HIT_MANY + bytes((count,))
     )
 
 
+def send_packet(sock: socket.socket, data) -> None:
+    """
+    Sends a small packet with a single send call where possible.
+
+    Small protocol packets are almost always accepted by the kernel in
+    one send, so the common path costs exactly one syscall. Any bytes
+    that were not accepted are sent with sendall.
+
+    Input:
+        sock (socket.socket): The connected socket to send on.
+        data (bytes | bytearray | memoryview): The packet to send.
+
+    Output:
+        None
+    """
+    sent = sock.send(data)
+    if sent < len(data):
+        sock.sendall(memoryview(data)[sent:])
+
+
 def unpack_client_payload(data: bytes) -> str:
     """
     Unpacks and validates a client decision payload received over TCP.
@@ -305,8 +491,9 @@ def unpack_client_payload(data: bytes) -> str:
         expected to contain a complete client payload.
 
     Output:
-        str: The player's decision as a string.
-            Returns "Hit" or "Stand".
+        str | tuple[str, int]: The player's decision.
+            Returns "Hit" or "Stand", or ("HitN", count) when the player
+            asks for up to count cards in a row.
 
     Raises:
         ValueError: If the payload is too short, does not match the
@@ -317,25 +504,22 @@ def unpack_client_payload(data: bytes) -> str:
         raise ValueError("Client payload too short")
 
     # Unpack the client payload according to the defined format
-    cookie, msg_type, raw_decision = struct.unpack(
-        _CLIENT_PAYLOAD_FMT, data[:_CLIENT_PAYLOAD_SIZE]
-    )
+    cookie, msg_type, raw_decision = _CLIENT_PAYLOAD.unpack_from(data, 0)
 
     # Validate protocol identifiers
     if cookie != MAGIC_COOKIE or msg_type != PAYLOAD_TYPE:
         raise ValueError("Invalid client payload")
 
-    # Remove padding null bytes from the decision field
-    decision = raw_decision.rstrip(b"\x00")
-
-    # Decode the decision into a human-readable command
-    if decision == DECISION_HIT:
-        return "Hit"
-    if decision == DECISION_STAND:
-        return "Stand"
+    # A multi-hit request carries its card count in the last byte
+    if raw_decision[:4] == DECISION_HIT_MANY and raw_decision[4]:
+        return "HitN", raw_decision[4]
 
-    # Decision value is not recognized
-    raise ValueError("Unknown decision")
+    # Decode the decision (without null padding) into a human-readable command
+    try:
+        return _DECISION_NAMES[raw_decision.rstrip(b"\x00")]
+    except KeyError:
+        # Decision value is not recognized
+        raise ValueError("Unknown decision") from None
 
 
 # -----------------------------
@@ -343,7 +527,8 @@ def unpack_client_payload(data: bytes) -> str:
 # -----------------------------
 # Format: cookie(4) | type(1) | result(1) | rank(2) | suit(1)
 _SERVER_PAYLOAD_FMT = "!I B B H B"
-_SERVER_PAYLOAD_SIZE = struct.calcsize(_SERVER_PAYLOAD_FMT)
+_SERVER_PAYLOAD = struct.Struct(_SERVER_PAYLOAD_FMT)
+_SERVER_PAYLOAD_SIZE = _SERVER_PAYLOAD.size
 
 def pack_server_payload(result: int, rank: int, suit: int) -> bytes:
     """
@@ -367,8 +552,7 @@ def pack_server_payload(result: int, rank: int, suit: int) -> bytes:
         formatted according to _SERVER_PAYLOAD_FMT and ready to be sent
         over a TCP socket.
     """
-    return struct.pack(
-        _SERVER_PAYLOAD_FMT,
+    return _SERVER_PAYLOAD.pack(
         MAGIC_COOKIE,
         PAYLOAD_TYPE,
         result,
@@ -407,9 +591,7 @@ def unpack_server_payload(data: bytes):
         raise ValueError("Server payload too short")
 
     # Unpack the payload according to the server payload format
-    cookie, msg_type, result, rank, suit = struct.unpack(
-        _SERVER_PAYLOAD_FMT, data[:_SERVER_PAYLOAD_SIZE]
-    )
+    cookie, msg_type, result, rank, suit = _SERVER_PAYLOAD.unpack_from(data, 0)
 
     # Validate protocol identifiers
     if cookie != MAGIC_COOKIE or msg_type != PAYLOAD_TYPE:
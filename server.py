@@ -1,7 +1,16 @@
 # server.py
+import asyncio
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import selectors
 import socket
+import sys
 import threading
 import time
+import traceback
 import random
 from protocol import *
 
@@ -17,37 +26,86 @@ CLIENT_PAYLOAD_SIZE = 10
 SUITS = [0, 1, 2, 3]
 RANKS = list(range(1, 14))
 
+# A card is a single byte packing rank | suit << 4, so hands are plain
+# bytearrays instead of lists of (rank, suit) tuples
+def pack_card(rank: int, suit: int) -> int:
+    """
+    Packs a card into its one-byte code.
+
+    Input:
+        rank (int): The rank of the card (1–13).
+        suit (int): The suit of the card (0–3).
+
+    Output:
+        int: The card code, rank | suit << 4.
+    """
+    return rank | suit << 4
+
+# All 52 card codes, built once and copied into every new deck
+_FULL_DECK = bytes(pack_card(rank, suit) for suit in SUITS for rank in RANKS)
+
+# Server payload and (rank, suit) pair for every possible card byte,
+# indexed directly by the card code
+CARD_PAYLOAD_BY_BYTE = [
+    pack_server_payload(RESULT_NOT_OVER, code & 0xF, code >> 4)
+    for code in range(256)
+]
+_CARD_PAIR = [(code & 0xF, code >> 4) for code in range(256)]
+
+# Server payloads for every result marker, packed once
+RESULT_PAYLOAD = {
+    result: pack_server_payload(result, 0, 0)
+    for result in (RESULT_NOT_OVER, RESULT_TIE, RESULT_LOSS, RESULT_WIN)
+}
+
+# Blackjack value of each rank, indexed by rank (index 0 is unused)
+_CARD_VALUE = (0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10)
+
 class Deck:
     """
     Represents a standard shuffled deck of playing cards for Blackjack.
 
     The deck contains all combinations of ranks and suits and supports
-    drawing cards one at a time.
+    drawing cards one at a time. Instead of shuffling all 52 cards up
+    front, each draw picks a random card among those not yet drawn (one
+    step of a Fisher-Yates shuffle), so a round only pays for the few
+    cards it actually uses.
     """
-    def __init__(self):
+    def __init__(self, rng=random):
         """
-        Initializes a new shuffled deck.
+        Initializes a new deck with all 52 cards available.
 
         Input:
-            None
+            rng: The random number generator used to pick cards. Defaults
+            to the random module; pass a seeded random.Random to get a
+            reproducible deck.
 
         Output:
             None
         """
-        self.cards = [(rank, suit) for suit in SUITS for rank in RANKS]
-        random.shuffle(self.cards)
+        self.cards = bytearray(_FULL_DECK)
+        self.remaining = len(self.cards)
+        self.rng = rng
 
     def draw(self):
         """
-        Draws and removes the top card from the deck.
+        Draws a uniformly random card from the cards not yet drawn.
+
+        The chosen card is swapped to the end of the undrawn part of the
+        deck, which then shrinks by one.
 
         Input:
             None
 
         Output:
-            tuple[int, int]: A card represented as (rank, suit).
+            int: The card's one-byte code (see pack_card).
         """
-        return self.cards.pop()
+        cards = self.cards
+        i = self.rng.randrange(self.remaining)
+        self.remaining -= 1
+        last = self.remaining
+        cards[i], cards[last] = cards[last], cards[i]
+        return cards[last]
 
 def card_value(rank: int) -> int:
     """
@@ -65,24 +123,59 @@ def card_value(rank: int) -> int:
             face cards are counted as 10,
             numeric cards keep their numeric value.
     """
-    if rank == 1:
-        return 11
-    if rank >= 11:
-        return 10
-    return rank
+    return _CARD_VALUE[rank]
 
 def hand_value(hand):
     """
     Calculates the total Blackjack value of a hand.
 
     Input:
-        hand (list[tuple[int, int]]): A list of cards,
-        where each card is represented as (rank, suit).
+        hand (bytes | bytearray): The hand's card codes (see pack_card).
 
     Output:
         int: The sum of the Blackjack values of all cards in the hand.
     """
-    return sum(card_value(rank) for rank, _ in hand)
+    return sum(_CARD_VALUE[card & 0xF] for card in hand)
+
+
+class HandLog:
+    """
+    Shows a hand of card codes as (rank, suit) pairs in log messages.
+
+    The pairs are only built if the message is actually formatted, so
+    disabled log calls stay cheap.
+    """
+    __slots__ = ("hand",)
+
+    def __init__(self, hand):
+        """
+        Wraps a hand for logging without copying it.
+
+        Input:
+            hand (bytes | bytearray): The hand's card codes (see pack_card).
+
+        Output:
+            None
+        """
+        self.hand = hand
+
+    def __str__(self):
+        """
+        Formats the hand as a list of (rank, suit) pairs.
+
+        Input:
+            None
+
+        Output:
+            str: The hand, e.g. "[(12, 1), (10, 3)]".
+        """
+        return str([_CARD_PAIR[card] for card in self.hand])
+
+# Use the compiled deck and scoring from bj_core.pyx when it has been built
+try:
+    from bj_core import FastDeck as Deck, card_value, hand_value
+except ImportError:
+    pass
 
 # -----------------------------
 # Configuration
@@ -90,11 +183,80 @@ def hand_value(hand):
 SERVER_NAME = "BlackijeckyServer"
 BROADCAST_IP = "<broadcast>"
 TCP_BACKLOG = 20
+CLIENT_TIMEOUT = 60
+
+# Offer broadcast interval bounds (seconds) and growth factor while idle
+BEACON_MIN_INTERVAL = 1.0
+BEACON_MAX_INTERVAL = 10.0
+BEACON_BACKOFF = 1.5
+
+# Connections accepted since the last offer broadcast. Kept in shared
+# memory so that forked workers' connections are counted as well.
+new_connection_count = multiprocessing.RawValue("L", 0)
+MAX_CLIENTS_PER_WORKER = 32
+REUSEPORT_SUPPORTED = hasattr(socket, "SO_REUSEPORT")
+
+# -----------------------------
+# Logging
+# -----------------------------
+# Per-round events are logged at INFO, which is disabled by default so
+# their messages are never even formatted. Records that are emitted go
+# through a queue and are written by a single background listener, so
+# client threads never block on stdout.
+logger = logging.getLogger("bj")
+logger.setLevel(logging.WARNING)
+
+def setup_logging(verbose: bool = False):
+    """
+    Routes the server log through a queue to a background writer thread.
+
+    Input:
+        verbose (bool): Whether to log per-round game events (INFO level)
+        in addition to warnings and errors.
+
+    Output:
+        logging.handlers.QueueListener: The started listener that writes
+        queued records to stdout.
+    """
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stdout)
+    )
+    listener.start()
+    return listener
+
 
 # -----------------------------
 # UDP Offer Broadcaster
 # -----------------------------
-def udp_broadcast_loop(tcp_port: int):
+def next_beacon_interval(interval: float) -> float:
+    """
+    Computes the delay until the next UDP offer broadcast.
+
+    While no new clients connect, the interval grows by
+    BEACON_BACKOFF up to BEACON_MAX_INTERVAL; as soon as a client
+    connects it drops back to BEACON_MIN_INTERVAL.
+
+    Input:
+        interval (float): The interval used for the previous broadcast.
+
+    Output:
+        float: The interval to wait before the next broadcast.
+    """
+    # Read and reset the count of connections since the last broadcast
+    new_connections = new_connection_count.value
+    new_connection_count.value = 0
+
+    if new_connections:
+        return BEACON_MIN_INTERVAL
+    return min(interval * BEACON_BACKOFF, BEACON_MAX_INTERVAL)
+
+
+def udp_broadcast_loop(tcp_port: int, server_name: str = SERVER_NAME):
     """
     Periodically broadcasts UDP offer packets to announce the server's
     availability to potential clients.
@@ -107,6 +269,7 @@ def udp_broadcast_loop(tcp_port: int):
     Input:
         tcp_port (int): The TCP port on which the server is listening
         for incoming client connections.
+        server_name (str): The name announced in the offers.
 
     Output:
         None
@@ -119,15 +282,158 @@ def udp_broadcast_loop(tcp_port: int):
     udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
     # Prepare the offer packet once to avoid rebuilding it in every iteration
-    offer_packet = pack_offer(tcp_port, SERVER_NAME)
+    offer_packet = pack_offer(tcp_port, server_name)
 
-    # Continuously broadcast the offer at a fixed interval
+    # Continuously broadcast the offer, scheduling each send against an
+    # absolute deadline so the interval does not drift
+    interval = BEACON_MIN_INTERVAL
+    deadline = time.monotonic()
     while True:
         # Send the offer to the broadcast address and well-known UDP port
         udp_sock.sendto(offer_packet, (BROADCAST_IP, UDP_PORT))
 
         # Sleep to limit broadcast frequency and reduce network load
-        time.sleep(1)
+        interval = next_beacon_interval(interval)
+        deadline += interval
+        time.sleep(max(0.0, deadline - time.monotonic()))
+
+
+# -----------------------------
+# One Blackjack round
+# -----------------------------
+def play_round(r: int, deck=None):
+    """
+    Runs the game logic of a single Blackjack round.
+
+    The round is written as a generator so that the same logic can be
+    driven by the threaded server and by the asyncio server. Each value
+    yielded is a batch of payload bytes to send to the client, after
+    which the caller must receive the player's next decision and pass
+    it back with send(). When the round is over, the final payloads
+    (dealer cards and result marker) are returned instead of yielded.
+
+    Input:
+        r (int): The round number (used for logging).
+        deck (Deck | None): The deck to deal from. A new shuffled deck
+        is used when not provided.
+
+    Output:
+        Generator[bytes, str, bytes]: Yields payloads that expect a
+        decision ("Hit", ("HitN", count) or "Stand") in reply and
+        returns the final payloads of the round.
+    """
+    # Initialize a new shuffled deck and deal initial hands
+    if deck is None:
+        deck = Deck()
+
+    # Bound once per round so the per-card lookups skip global and
+    # attribute resolution
+    draw = deck.draw
+    card_payload = CARD_PAYLOAD_BY_BYTE.__getitem__
+
+    player_hand = bytearray((draw(), draw()))
+    dealer_hand = bytearray((draw(), draw()))
+
+    # Running totals, updated on every draw instead of re-scanning the hands
+    player_total = hand_value(player_hand)
+    dealer_total = hand_value(dealer_hand)
+
+    # Log initial hands on the server side
+    logger.info("[ROUND %d] Player initial hand: %s (total=%s)", r, HandLog(player_hand), player_total)
+    logger.info("[ROUND %d] Dealer initial hand: %s (total=%s)", r, HandLog(dealer_hand), dealer_total)
+
+    # Send initial cards to the client in a single write:
+    # two cards for the player and one visible card for the dealer
+    decision = yield b"".join([
+        card_payload(player_hand[0]),
+        card_payload(player_hand[1]),
+        card_payload(dealer_hand[0]),
+    ])
+
+    # -------- Player turn --------
+    # Track whether the player has busted
+    player_bust = False
+
+    while True:
+        # The caller has received the player's decision (Hit, HitN or Stand)
+        if decision == "Hit":
+            hits = 1
+        elif isinstance(decision, tuple):
+            # Deal up to the requested number of cards in one go
+            hits = decision[1]
+        else:
+            # Player chooses to stand
+            logger.info("[ROUND %d] Player stands with total=%s", r, player_total)
+            dealer_payloads = []
+            break
+
+        drawn = []
+        for _ in range(hits):
+            # Deal a card to the player
+            card = draw()
+            player_hand.append(card)
+            player_total += _CARD_VALUE[card & 0xF]
+            drawn.append(card_payload(card))
+
+            logger.info("[ROUND %d] Player hits and draws %s, total=%s", r, _CARD_PAIR[card], player_total)
+
+            # Check if the player busts
+            if player_total > 21:
+                logger.info("[ROUND %d] Player busts", r)
+                player_bust = True
+                break
+
+        if player_bust:
+            # The drawn cards are sent along with the dealer phase
+            dealer_payloads = drawn
+            break
+
+        # Always send drawn cards with RESULT_NOT_OVER, then wait for
+        # the next decision
+        decision = yield b"".join(drawn)
+
+    # -------- Dealer full hand streaming (always) --------
+    # Reveal the dealer's hidden card so the client can display the full hand
+    # The whole dealer phase is collected and sent in a single write
+    hidden = dealer_hand[1]
+    dealer_payloads.append(card_payload(hidden))
+    logger.info("[ROUND %d] Dealer reveals hidden card %s", r, _CARD_PAIR[hidden])
+
+    # Draw additional dealer cards only if the player did not bust
+    if not player_bust:
+        while dealer_total < 17:
+            card = draw()
+            dealer_hand.append(card)
+            dealer_total += _CARD_VALUE[card & 0xF]
+            logger.info("[ROUND %d] Dealer draws %s, total=%s", r, _CARD_PAIR[card], dealer_total)
+            dealer_payloads.append(card_payload(card))
+
+    # -------- Decide result --------
+    # Determine the round outcome according to Blackjack rules
+    if player_bust:
+        result = RESULT_LOSS
+    else:
+        if dealer_total > 21:
+            result = RESULT_WIN
+        elif dealer_total > player_total:
+            result = RESULT_LOSS
+        elif dealer_total < player_total:
+            result = RESULT_WIN
+        else:
+            result = RESULT_TIE
+
+    # Append the final result marker (no card data, only the result code)
+    # so the dealer's cards are sent together with it
+    dealer_payloads.append(RESULT_PAYLOAD[result])
+
+    # Log final state of the round
+    logger.info("[ROUND %d] Final hands", r)
+    logger.info("[ROUND %d] Player hand: %s (total=%s)", r, HandLog(player_hand), player_total)
+    logger.info("[ROUND %d] Dealer hand: %s (total=%s)", r, HandLog(dealer_hand), dealer_total)
+    logger.info("[ROUND %d] Result sent: %s", r, result)
+
+    # The final payloads need no further decision from the player
+    return b"".join(dealer_payloads)
 
 
 # -----------------------------
@@ -137,7 +443,7 @@ def handle_client(client_sock: socket.socket, client_addr):
     """
     Handles a complete Blackjack session for a single connected client.
 
-    This function runs on a dedicated thread per client. It receives the
+    This function runs on a worker thread for each client. It receives the
     game request, manages multiple Blackjack rounds, streams all game
     events to the client according to the protocol, and determines the
     final outcome of each round.
@@ -153,178 +459,398 @@ def handle_client(client_sock: socket.socket, client_addr):
     """
     try:
         # Set a timeout to prevent blocking indefinitely on a stalled client
-        client_sock.settimeout(60)
+        client_sock.settimeout(CLIENT_TIMEOUT)
 
         # Receive and unpack the initial game request from the client
         rounds, client_name = unpack_request(
             recv_exact(client_sock, REQUEST_SIZE)
         )
-        print(f"[TCP] Request from '{client_name}', rounds={rounds}")
+        logger.info("[TCP] Request from '%s', rounds=%d", client_name, rounds)
+
+        # Single receive buffer reused for every decision of the session
+        decision_buf = bytearray(CLIENT_PAYLOAD_SIZE)
+        decision_view = memoryview(decision_buf)
 
         # Iterate over the requested number of Blackjack rounds
         for r in range(1, rounds + 1):
-            print(f"\n[ROUND {r}/{rounds}] Start")
+            logger.info("[ROUND %d/%d] Start", r, rounds)
 
-            # Initialize a new shuffled deck and deal initial hands
-            deck = Deck()
-            player_hand = [deck.draw(), deck.draw()]
-            dealer_hand = [deck.draw(), deck.draw()]
+            # Run the round, sending each batch of payloads and feeding
+            # back the player's decision whenever the round asks for one
+            game = play_round(r)
+            data = next(game)
+            while True:
+                client_sock.sendall(data)
 
-            # Log initial hands on the server side
-            print(f"[ROUND {r}] Player initial hand: {player_hand} (total={hand_value(player_hand)})")
-            print(f"[ROUND {r}] Dealer initial hand: {dealer_hand} (total={hand_value(dealer_hand)})")
+                # Receive the player's decision (Hit or Stand)
+                recv_exact_into(client_sock, decision_view, CLIENT_PAYLOAD_SIZE)
+                decision = unpack_client_payload(decision_buf)
+                try:
+                    data = game.send(decision)
+                except StopIteration as end:
+                    client_sock.sendall(end.value)
+                    break
 
-            # Send initial cards to the client:
-            # two cards for the player and one visible card for the dealer
-            for rank, suit in player_hand:
-                client_sock.sendall(pack_server_payload(RESULT_NOT_OVER, rank, suit))
+        # All rounds completed for this client
+        logger.info("[TCP] Finished session for '%s'", client_name)
 
-            client_sock.sendall(
-                pack_server_payload(RESULT_NOT_OVER, dealer_hand[0][0], dealer_hand[0][1])
-            )
+    except Exception as e:
+        # Worker threads do not report errors on their own
+        logger.warning("[TCP] Error with client %s: %s", client_addr, e)
 
-            # -------- Player turn --------
-            # Track whether the player has busted
-            player_bust = False
+    finally:
+        # Ensure the client socket is always closed
+        client_sock.close()
 
-            while True:
-                # Receive the player's decision (Hit or Stand)
-                decision = unpack_client_payload(
-                    recv_exact(client_sock, CLIENT_PAYLOAD_SIZE)
-                )
 
-                if decision == "Hit":
-                    # Deal a card to the player
-                    card = deck.draw()
-                    player_hand.append(card)
-                    total = hand_value(player_hand)
+async def handle_client_async(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Handles a complete Blackjack session for a single client on the
+    asyncio event loop.
 
-                    print(f"[ROUND {r}] Player hits and draws {card}, total={total}")
+    This is the coroutine counterpart of handle_client: it runs the same
+    play_round logic, but waits for the client without occupying a
+    thread, so many sessions can share one OS thread.
 
-                    # Always send drawn cards with RESULT_NOT_OVER
-                    client_sock.sendall(
-                        pack_server_payload(RESULT_NOT_OVER, card[0], card[1])
-                    )
+    Input:
+        reader (asyncio.StreamReader): Stream for data from the client.
+        writer (asyncio.StreamWriter): Stream for data to the client.
 
-                    # Check if the player busts
-                    if total > 21:
-                        print(f"[ROUND {r}] Player busts")
-                        player_bust = True
-                        break
-                else:
-                    # Player chooses to stand
-                    print(f"[ROUND {r}] Player stands with total={hand_value(player_hand)}")
-                    break
+    Output:
+        None
+    """
+    client_addr = writer.get_extra_info("peername")
 
-            # -------- Dealer full hand streaming (always) --------
-            # Reveal the dealer's hidden card so the client can display the full hand
-            hidden = dealer_hand[1]
-            client_sock.sendall(pack_server_payload(RESULT_NOT_OVER, hidden[0], hidden[1]))
-            print(f"[ROUND {r}] Dealer reveals hidden card {hidden}")
-
-            # Draw additional dealer cards only if the player did not bust
-            if not player_bust:
-                while hand_value(dealer_hand) < 17:
-                    card = deck.draw()
-                    dealer_hand.append(card)
-                    print(f"[ROUND {r}] Dealer draws {card}, total={hand_value(dealer_hand)}")
-                    client_sock.sendall(pack_server_payload(RESULT_NOT_OVER, card[0], card[1]))
-
-            # Compute final hand values
-            dealer_total = hand_value(dealer_hand)
-            player_total = hand_value(player_hand)
-
-            # -------- Decide result --------
-            # Determine the round outcome according to Blackjack rules
-            if player_bust:
-                result = RESULT_LOSS
-            else:
-                if dealer_total > 21:
-                    result = RESULT_WIN
-                elif dealer_total > player_total:
-                    result = RESULT_LOSS
-                elif dealer_total < player_total:
-                    result = RESULT_WIN
-                else:
-                    result = RESULT_TIE
-
-            # Send final result marker (no card data, only the result code)
-            client_sock.sendall(pack_server_payload(result, 0, 0))
-
-            # Log final state of the round
-            print(f"[ROUND {r}] Final hands")
-            print(f"[ROUND {r}] Player hand: {player_hand} (total={player_total})")
-            print(f"[ROUND {r}] Dealer hand: {dealer_hand} (total={dealer_total})")
-            print(f"[ROUND {r}] Result sent: {result}")
+    # Let the broadcaster know clients are arriving
+    new_connection_count.value += 1
+
+    try:
+        # Disable Nagle so each card payload is sent without delay
+        writer.get_extra_info("socket").setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+        )
+
+        # Receive and unpack the initial game request from the client
+        rounds, client_name = unpack_request(
+            await asyncio.wait_for(reader.readexactly(REQUEST_SIZE), CLIENT_TIMEOUT)
+        )
+        logger.info("[TCP] Request from '%s', rounds=%d", client_name, rounds)
+
+        # Iterate over the requested number of Blackjack rounds
+        for r in range(1, rounds + 1):
+            logger.info("[ROUND %d/%d] Start", r, rounds)
+
+            game = play_round(r)
+            data = next(game)
+            while True:
+                writer.write(data)
+                await writer.drain()
+
+                # Receive the player's decision (Hit or Stand)
+                decision = unpack_client_payload(
+                    await asyncio.wait_for(
+                        reader.readexactly(CLIENT_PAYLOAD_SIZE), CLIENT_TIMEOUT
+                    )
+                )
+                try:
+                    data = game.send(decision)
+                except StopIteration as end:
+                    writer.write(end.value)
+                    await writer.drain()
+                    break
 
         # All rounds completed for this client
-        print(f"\n[TCP] Finished session for '{client_name}'")
+        logger.info("[TCP] Finished session for '%s'", client_name)
+
+    except Exception as e:
+        logger.warning("[TCP] Error with client %s: %s", client_addr, e)
 
     finally:
-        # Ensure the client socket is always closed
-        client_sock.close()
+        # Ensure the client connection is always closed
+        writer.close()
 
 # -----------------------------
 # TCP Server
 # -----------------------------
-def start_tcp_server():
+def create_listen_socket(port: int) -> socket.socket:
     """
-    Starts the TCP server and listens for incoming client connections.
+    Creates a listening TCP socket bound to the given port.
 
-    This function creates a TCP socket, binds it to an available port,
-    and begins listening for client connections. It also starts a
-    background thread that periodically broadcasts UDP offer packets
-    so that clients can discover the server.
+    SO_REUSEPORT is enabled where available so that several worker
+    processes can each bind their own socket to the same port and let
+    the kernel spread new connections between them.
 
-    For each incoming TCP connection, a new thread is spawned to handle
-    the client session independently.
-    
     Input:
-        None
+        port (int): The TCP port to bind to, or 0 for an ephemeral port.
 
     Output:
-        None
+        socket.socket: A bound socket that is listening for connections.
     """
-
     # Create a TCP socket for client connections
     tcp_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
     # Allow address reuse to avoid bind errors when restarting the server
     tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if REUSEPORT_SUPPORTED:
+        tcp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
-    # Bind to an ephemeral port chosen by the operating system
-    tcp_sock.bind(("", 0))
+    tcp_sock.bind(("", port))
 
     # Start listening for incoming TCP connections
     tcp_sock.listen(TCP_BACKLOG)
+    return tcp_sock
+
+
+def session_worker(work_queue: queue.SimpleQueue, handler):
+    """
+    Runs client sessions taken from a shared work queue, forever.
+
+    Input:
+        work_queue (queue.SimpleQueue): Queue of (client_sock, client_addr)
+        pairs put there by the accept loop.
+        handler: The session function, called as handler(client_sock,
+        client_addr).
+
+    Output:
+        None
+    """
+    get = work_queue.get
+    while True:
+        client_sock, client_addr = get()
+        handler(client_sock, client_addr)
+
+
+def accept_loop(tcp_sock: socket.socket, handler=handle_client):
+    """
+    Accepts client connections and hands them to a fixed set of
+    worker threads.
+
+    The workers are started once and pull sessions from a shared
+    queue.SimpleQueue, so the accept loop only enqueues the socket and
+    no thread is created per client. Extra clients wait in the queue
+    until a worker is free.
+
+    The listening socket is non-blocking: each wakeup drains all
+    pending connections from the kernel's accept queue at once.
+
+    Input:
+        tcp_sock (socket.socket): A listening TCP socket.
+        handler: The session function, called as handler(client_sock,
+        client_addr). Defaults to handle_client.
+
+    Output:
+        None
+    """
+    work_queue = queue.SimpleQueue()
+    for _ in range(MAX_CLIENTS_PER_WORKER):
+        threading.Thread(
+            target=session_worker,
+            args=(work_queue, handler),
+            daemon=True
+        ).start()
+
+    # Wait for readiness with epoll (or the platform's equivalent) and
+    # then accept every pending connection before sleeping again
+    tcp_sock.setblocking(False)
+    selector = selectors.DefaultSelector()
+    selector.register(tcp_sock, selectors.EVENT_READ)
+
+    put = work_queue.put
+    while True:
+        selector.select()
+        while True:
+            # Accept a new client connection
+            try:
+                client_sock, client_addr = tcp_sock.accept()
+            except BlockingIOError:
+                break
+
+            # Sessions use blocking I/O with a timeout on their own socket
+            client_sock.setblocking(True)
+
+            # Disable Nagle so each card payload is sent without delay
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            # Let the broadcaster know clients are arriving
+            new_connection_count.value += 1
+
+            # Hand the session to a waiting worker thread
+            put((client_sock, client_addr))
+
+
+def exit_with_parent(parent_pipe: int):
+    """
+    Terminates a forked worker process once the main process is gone.
+
+    The main process holds the write end of a pipe and never writes to
+    it. However the main process exits, the kernel closes that end and
+    the blocking read below returns EOF, so workers never outlive the
+    process that broadcasts their offers.
+
+    Input:
+        parent_pipe (int): The read end of the pipe shared with the
+        main process.
+
+    Output:
+        None
+    """
+    os.read(parent_pipe, 1)
+    os._exit(0)
+
+
+def start_tcp_server(handler=handle_client, verbose: bool = False,
+                     server_name: str = SERVER_NAME):
+    """
+    Starts the TCP server and listens for incoming client connections.
+
+    This function creates a TCP socket, binds it to an available port,
+    and begins listening for client connections. It also starts a
+    background thread that periodically broadcasts UDP offer packets
+    so that clients can discover the server.
+
+    Where SO_REUSEPORT and fork are available, one worker process per
+    CPU binds its own socket to the same port and runs its own accept
+    loop, so connections are balanced by the kernel instead of all
+    contending on a single accept queue. Each worker serves its clients
+    on a fixed set of worker threads and exits when the main process
+    does. The workers are forked before any thread is started, and every
+    process then sets up its own logging.
+
+    Input:
+        handler: The session function for each accepted client.
+        Defaults to handle_client.
+        verbose (bool): Whether to log per-round game events, passed to
+        setup_logging in every process.
+        server_name (str): The name announced in the UDP offers.
+
+    Output:
+        None
+    """
+
+    # Bind to an ephemeral port chosen by the operating system
+    tcp_sock = create_listen_socket(0)
 
     # Retrieve and display the assigned TCP port
     tcp_port = tcp_sock.getsockname()[1]
     print(f"Server started, TCP port {tcp_port}")
 
+    # Fork additional workers, each with its own socket on the same port
+    if REUSEPORT_SUPPORTED and hasattr(os, "fork"):
+        # Workers watch this pipe to exit together with the main process
+        parent_pipe, parent_alive = os.pipe()
+        # Flush first so workers do not inherit and repeat buffered output
+        sys.stdout.flush()
+        for _ in range((os.cpu_count() or 1) - 1):
+            if os.fork() == 0:
+                # A worker must never unwind into the main process's code
+                try:
+                    os.close(parent_alive)
+                    tcp_sock.close()
+                    setup_logging(verbose)
+                    threading.Thread(
+                        target=exit_with_parent,
+                        args=(parent_pipe,),
+                        daemon=True
+                    ).start()
+                    accept_loop(create_listen_socket(tcp_port), handler)
+                except Exception:
+                    traceback.print_exc()
+                finally:
+                    os._exit(1)
+
+    # Only start threads once all workers have been forked
+    setup_logging(verbose)
+
     # Start a background thread to broadcast UDP offers for server discovery
     threading.Thread(
         target=udp_broadcast_loop,
-        args=(tcp_port,),
+        args=(tcp_port, server_name),
         daemon=True
     ).start()
 
-    # Main accept loop: handle each client in a separate thread
-    while True:
-        # Accept a new client connection
-        client_sock, client_addr = tcp_sock.accept()
+    # The main process serves clients as well
+    accept_loop(tcp_sock, handler)
 
-        # Spawn a dedicated thread to handle the connected client
-        threading.Thread(
-            target=handle_client,
-            args=(client_sock, client_addr),
-            daemon=True
-        ).start()
+
+async def udp_broadcast_task(tcp_port: int):
+    """
+    Periodically broadcasts UDP offer packets from the asyncio event loop.
+
+    This is the coroutine counterpart of udp_broadcast_loop, used when
+    the server runs in asyncio mode.
+
+    Input:
+        tcp_port (int): The TCP port on which the server is listening
+        for incoming client connections.
+
+    Output:
+        None
+    """
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol,
+        family=socket.AF_INET,
+        allow_broadcast=True
+    )
+
+    # Prepare the offer packet once to avoid rebuilding it in every iteration
+    offer_packet = pack_offer(tcp_port, SERVER_NAME)
+
+    try:
+        interval = BEACON_MIN_INTERVAL
+        deadline = loop.time()
+        while True:
+            transport.sendto(offer_packet, (BROADCAST_IP, UDP_PORT))
+            interval = next_beacon_interval(interval)
+            deadline += interval
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+    finally:
+        transport.close()
+
+
+async def start_async_server():
+    """
+    Starts the TCP server on a single-threaded asyncio event loop.
+
+    All client sessions run as coroutines on one thread using the
+    operating system's readiness notification (epoll on Linux), and the
+    UDP offers are broadcast by a task on the same loop.
+
+    Input:
+        None
+
+    Output:
+        None
+    """
+    server = await asyncio.start_server(
+        handle_client_async,
+        host="",
+        port=0,
+        family=socket.AF_INET,
+        backlog=TCP_BACKLOG
+    )
+
+    # Retrieve and display the assigned TCP port
+    tcp_port = server.sockets[0].getsockname()[1]
+    print(f"Server started, TCP port {tcp_port}")
+
+    # Keep a reference to the task so it is not garbage collected
+    broadcaster = asyncio.create_task(udp_broadcast_task(tcp_port))
+    async with server:
+        await server.serve_forever()
 
 
 # -----------------------------
 # Main
 # -----------------------------
 if __name__ == "__main__":
-    start_tcp_server()
+    # "-v" / "--verbose" logs every round's events
+    verbose = "-v" in sys.argv[1:] or "--verbose" in sys.argv[1:]
+
+    # "--asyncio" serves all clients from a single event-loop thread
+    if "--asyncio" in sys.argv[1:]:
+        setup_logging(verbose)
+        asyncio.run(start_async_server())
+    else:
+        start_tcp_server(verbose=verbose)
 
@@ -0,0 +1,217 @@
+# tape.py
+# Pre-generated round "tapes" for benchmarking and replay.
+#
+# A tape holds the exact bytes the server would send for a sequence of
+# rounds, played from seeded decks with a fixed decision trace. A tape
+# server streams those bytes straight from the file with sendfile, so no
+# game logic or packing runs while serving.
+#
+# Usage:
+#   python tape.py build <tape_path> <rounds> [trace] [seed]
+#   python tape.py serve <tape_path>
+#
+# The trace is a string of "H" (hit) and "S" (stand) decisions used for
+# every round, e.g. "HS". Clients of a tape server must send the same
+# decisions, so it is meant for scripted load-testing clients. A tape
+# server announces itself as TAPE_SERVER_NAME so ordinary clients can
+# tell it apart from a real game server.
+import json
+import random
+import socket
+import sys
+from functools import partial
+
+from protocol import *
+from server import (
+    Deck,
+    logger,
+    play_round,
+    start_tcp_server,
+    REQUEST_SIZE,
+    CLIENT_PAYLOAD_SIZE,
+    CLIENT_TIMEOUT,
+)
+
+_TRACE_DECISIONS = {"H": "Hit", "S": "Stand"}
+
+TAPE_SERVER_NAME = "BlackijeckyTape"
+
+# -----------------------------
+# Building tapes
+# -----------------------------
+def record_round(r: int, seed: int, trace: str):
+    """
+    Plays one round from a seeded deck and records what the server sends.
+
+    Input:
+        r (int): The round number (used for logging).
+        seed (int): Seed for the deck's random number generator.
+        trace (str): Decisions to play, "H" for hit and "S" for stand.
+        If the trace runs out before the round ends, the player stands.
+
+    Output:
+        list[bytes]: The payload batches of the round, in order. The
+        first is sent right away and each later one after receiving
+        one decision from the client.
+    """
+    game = play_round(r, Deck(random.Random(seed)))
+    segments = [next(game)]
+    decisions = iter(trace)
+
+    while True:
+        decision = _TRACE_DECISIONS[next(decisions, "S")]
+        try:
+            segments.append(game.send(decision))
+        except StopIteration as end:
+            segments.append(end.value)
+            return segments
+
+
+def build_tape(path: str, rounds: int, trace: str = "S", seed: int = 0):
+    """
+    Writes a tape file and its index for the given number of rounds.
+
+    The payload bytes of all rounds are written back to back to path,
+    and a JSON index with the trace and the (offset, length) of every
+    segment of every round is written to path + ".json".
+
+    Input:
+        path (str): Path of the tape file to create.
+        rounds (int): Number of rounds to record.
+        trace (str): Decisions played in every round ("H"/"S").
+        seed (int): Seed of the first round; round i uses seed + i.
+
+    Output:
+        None
+    """
+    index = []
+    offset = 0
+    with open(path, "wb") as tape:
+        for i in range(rounds):
+            round_index = []
+            for segment in record_round(i + 1, seed + i, trace):
+                tape.write(segment)
+                round_index.append((offset, len(segment)))
+                offset += len(segment)
+            index.append(round_index)
+
+    with open(path + ".json", "w") as f:
+        json.dump({"trace": trace, "rounds": index}, f)
+
+
+def load_tape_index(path: str):
+    """
+    Loads the decision trace and segment index of a tape file.
+
+    Input:
+        path (str): Path of the tape file.
+
+    Output:
+        tuple[str, list[list[tuple[int, int]]]]: The trace the tape was
+        recorded with, and for each round the (offset, length) of each
+        of its segments.
+    """
+    with open(path + ".json") as f:
+        tape_index = json.load(f)
+    return tape_index["trace"], tape_index["rounds"]
+
+
+def expected_decision(trace: str, i: int) -> str:
+    """
+    Returns the decision a client must send before a round's segment.
+
+    Input:
+        trace (str): The trace the tape was recorded with.
+        i (int): The index of the segment within its round (1 or more).
+
+    Output:
+        str: "Hit" or "Stand". Past the end of the trace the recorded
+        player stood, as in record_round.
+    """
+    return _TRACE_DECISIONS[trace[i - 1]] if i <= len(trace) else "Stand"
+
+# -----------------------------
+# Serving tapes
+# -----------------------------
+def handle_client_tape(client_sock: socket.socket, client_addr, path: str, trace: str, index):
+    """
+    Serves a client session from a pre-generated tape.
+
+    Each round replays one recorded round (cycling through the tape).
+    Segments are sent with socket.sendfile, which uses the zero-copy
+    os.sendfile where the platform supports it. Each decision from the
+    client is checked against the recorded trace, and the session is
+    closed on the first mismatch, since the tape cannot answer it.
+
+    Input:
+        client_sock (socket.socket): A connected TCP socket.
+        client_addr: The client's network address information.
+        path (str): Path of the tape file.
+        trace (str): The trace the tape was recorded with.
+        index: The tape's segment index, as returned by load_tape_index.
+
+    Output:
+        None
+    """
+    try:
+        client_sock.settimeout(CLIENT_TIMEOUT)
+
+        # Receive and unpack the initial game request from the client
+        rounds, client_name = unpack_request(
+            recv_exact(client_sock, REQUEST_SIZE)
+        )
+        logger.info("[TAPE] Request from '%s', rounds=%d", client_name, rounds)
+
+        decision_buf = bytearray(CLIENT_PAYLOAD_SIZE)
+        decision_view = memoryview(decision_buf)
+
+        # Each session opens its own file so sendfile offsets never race
+        with open(path, "rb") as tape:
+            for r in range(rounds):
+                segments = index[r % len(index)]
+                for i, (offset, length) in enumerate(segments):
+                    # Every segment after the first answers one decision,
+                    # which must be the one the tape was recorded with
+                    if i:
+                        recv_exact_into(client_sock, decision_view, CLIENT_PAYLOAD_SIZE)
+                        decision = unpack_client_payload(decision_buf)
+                        expected = expected_decision(trace, i)
+                        if decision != expected:
+                            logger.warning(
+                                "[TAPE] '%s' sent %s in round %d, tape expects %s",
+                                client_name, decision, r + 1, expected
+                            )
+                            return
+                    client_sock.sendfile(tape, offset, length)
+
+        logger.info("[TAPE] Finished session for '%s'", client_name)
+
+    except Exception as e:
+        logger.warning("[TAPE] Error with client %s: %s", client_addr, e)
+
+    finally:
+        client_sock.close()
+
+# -----------------------------
+# Main
+# -----------------------------
+if __name__ == "__main__":
+    if len(sys.argv) >= 4 and sys.argv[1] == "build":
+        build_tape(
+            sys.argv[2],
+            int(sys.argv[3]),
+            sys.argv[4] if len(sys.argv) > 4 else "S",
+            int(sys.argv[5]) if len(sys.argv) > 5 else 0
+        )
+    elif len(sys.argv) == 3 and sys.argv[1] == "serve":
+        tape_path = sys.argv[2]
+        tape_trace, tape_index = load_tape_index(tape_path)
+        start_tcp_server(
+            partial(handle_client_tape, path=tape_path, trace=tape_trace, index=tape_index),
+            verbose=True,
+            server_name=TAPE_SERVER_NAME
+        )
+    else:
+        print("usage: python tape.py build <tape_path> <rounds> [trace] [seed]")
+        print("       python tape.py serve <tape_path>")
+        sys.exit(1)